@@ -105,9 +105,9 @@ class LinearProbeTable(Generic[K, V]):
         :complexity: O(N) where N is self.table_size.
         """
         res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][0])
+        for item in self.array:
+            if item is not None:
+                res.append(item[0])
         return res
 
     def values(self) -> list[V]:
@@ -117,9 +117,9 @@ class LinearProbeTable(Generic[K, V]):
         :complexity: O(N) where N is self.table_size.
         """
         res = []
-        for x in range(self.table_size):
-            if self.array[x] is not None:
-                res.append(self.array[x][1])
+        for item in self.array:
+            if item is not None:
+                res.append(item[1])
         return res
 
     def __contains__(self, key: K) -> bool:
@@ -168,21 +168,24 @@ class LinearProbeTable(Generic[K, V]):
         Deletes a (key, value) pair in our hash table.
 
         :complexity best: O(hash(key)) deleting item is not probed and in correct spot.
-        :complexity worst: O(N*hash(key)+N^2*comp(K)) deleting item is midway through large chain.
+        :complexity worst: O(N*hash(key)) deleting item is midway through large chain.
         :raises KeyError: when the key doesn't exist.
         """
         position = self._linear_probe(key, False)
         # Remove the element
         self.array[position] = None
         self.count -= 1
-        # Start moving over the cluster
+        # Start moving over the cluster, shifting items back into the gap.
+        gap = position
         position = (position + 1) % self.table_size
         while self.array[position] is not None:
-            key2, value = self.array[position]
-            self.array[position] = None
-            # Reinsert.
-            newpos = self._linear_probe(key2, True)
-            self.array[newpos] = (key2, value)
+            item = self.array[position]
+            home = self.hash(item[0])
+            # The gap is on this item's probe path, so move it there.
+            if (position - home) % self.table_size >= (position - gap) % self.table_size:
+                self.array[gap] = item
+                self.array[position] = None
+                gap = position
             position = (position + 1) % self.table_size
 
     def is_empty(self) -> bool:
@@ -205,11 +208,13 @@ class LinearProbeTable(Generic[K, V]):
             # Cannot be resized further.
             return
         self.array = ArrayR(self.TABLE_SIZES[self.size_index])
-        self.count = 0
+        # Move the existing pairs straight into the new array, the count doesn't change.
         for item in old_array:
             if item is not None:
-                key, value = item
-                self[key] = value
+                self.array[self._linear_probe(item[0], True)] = item
+
+        if len(self) > self.table_size / 2:
+            self._rehash()
 
     def __str__(self) -> str:
         """
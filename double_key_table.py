@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Generic, TypeVar, Iterator
 from data_structures.hash_table import LinearProbeTable, FullError
 from data_structures.referential_array import ArrayR
@@ -8,6 +9,29 @@ K1 = TypeVar('K1')
 K2 = TypeVar('K2')
 V = TypeVar('V')
 
+# Multiplier sequences used by the polynomial hash, keyed by (table size, hash base).
+_MULTIPLIERS: dict[tuple[int, int], list[int]] = {}
+
+@lru_cache(maxsize=4096)
+def _poly_hash(key: str, table_size: int, hash_base: int) -> int:
+    """
+    Polynomial string hash shared by hash1 and hash2.
+
+    The multiplier sequence only depends on the table size, so it is computed
+    once and extended lazily as longer keys are hashed. Results are memoised,
+    as the same keys are hashed over and over by repeated lookups.
+
+    :complexity: O(len(key)), O(1) for a recently hashed key.
+    """
+    multipliers = _MULTIPLIERS.setdefault((table_size, hash_base), [31415])
+    while len(multipliers) < len(key):
+        multipliers.append(multipliers[-1] * hash_base % (table_size - 1))
+
+    value = 0
+    for char, a in zip(key, multipliers):
+        value = (ord(char) + a * value) % table_size
+    return value
+
 class DoubleKeyTable(Generic[K1, K2, V]):
     """
     Double Hash Table.
@@ -36,13 +60,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
 
         :complexity: O(len(key))
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % self.table_size
-            a = a * self.HASH_BASE % (self.table_size - 1)
-        return value
+        return _poly_hash(key, self.table_size, self.HASH_BASE)
 
     def hash2(self, key: K2, sub_table: LinearProbeTable[K2, V]) -> int:
         """
@@ -50,13 +68,7 @@ class DoubleKeyTable(Generic[K1, K2, V]):
 
         :complexity: O(len(key))
         """
-
-        value = 0
-        a = 31415
-        for char in key:
-            value = (ord(char) + a * value) % sub_table.table_size
-            a = a * self.HASH_BASE % (sub_table.table_size - 1)
-        return value
+        return _poly_hash(key, sub_table.table_size, self.HASH_BASE)
 
     def _linear_probe(self, key1: K1, key2: K2, is_insert: bool) -> tuple[int, int]:
         """